@@ -0,0 +1,47 @@
+
+import hashlib
+import mimetypes
+import os
+
+# On-disk cache for static bundles so CI re-runs and local dev loops stop
+# re-downloading the same JS/CSS on every verification run. Entries are keyed
+# by the MD5 of the request URL; the directory is safe to delete at any time.
+CACHE_DIR = os.path.join(os.path.dirname(__file__), ".cache_static")
+STATIC_URL_GLOB = "**/*.{js,css,woff2,png,svg}"
+
+
+def _cache_path(url):
+    ext = os.path.splitext(url.split("?", 1)[0])[1] or ".bin"
+    return os.path.join(CACHE_DIR, hashlib.md5(url.encode()).hexdigest() + ext)
+
+
+def _content_type(path):
+    return mimetypes.guess_type(path)[0] or "application/octet-stream"
+
+
+def cache_route(route):
+    """Serve a static asset from disk, fetching and persisting it on a miss."""
+    path = _cache_path(route.request.url)
+    if os.path.exists(path):
+        with open(path, "rb") as f:
+            route.fulfill(body=f.read(), content_type=_content_type(path))
+        return
+    response = route.fetch()
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(response.body())
+    route.fulfill(response=response)
+
+
+async def cache_route_async(route):
+    """Async twin of cache_route for flows driven by playwright.async_api."""
+    path = _cache_path(route.request.url)
+    if os.path.exists(path):
+        with open(path, "rb") as f:
+            await route.fulfill(body=f.read(), content_type=_content_type(path))
+        return
+    response = await route.fetch()
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(await response.body())
+    await route.fulfill(response=response)
@@ -0,0 +1,98 @@
+
+import os
+
+import pytest
+from playwright.sync_api import sync_playwright
+
+from cache_route import STATIC_URL_GLOB, cache_route
+from mocks import API_KEY_INIT_SCRIPT, install_api_mocks
+from routes import block_assets
+
+# Storage state dumped at the end of a run and reused on the next one, so
+# repeat runs start from a warmed-up SPA instead of a cold localStorage.
+# Gitignored; CI should cache it keyed on the frontend bundle.
+WARM_STATE = os.path.join(os.path.dirname(__file__), "warm_state.json")
+
+ARTIFACTS_DIR = os.path.join(os.path.dirname(__file__), "artifacts")
+
+
+def attach_diagnostics(page):
+    # Page errors are rare and cheap to forward. Full console forwarding is
+    # opt-in: the app logs heavily, and every console event is serialized
+    # across the driver boundary whether anyone reads it or not.
+    page.on("pageerror", lambda error: print(f"page error: {error}"))
+    if os.getenv("PW_VERBOSE"):
+        page.on("console", lambda msg: print(f"console [{msg.type}] {msg.text}"))
+
+
+@pytest.fixture(scope="session")
+def browser():
+    # Launching Chromium is the most expensive step of a Playwright run, so a
+    # single instance is shared by the whole session. Isolation between tests
+    # comes from the per-test context below.
+    with sync_playwright() as p:
+        browser = p.chromium.launch(headless=True)
+        yield browser
+        browser.close()
+
+
+@pytest.fixture
+def context_factory(browser):
+    # Builds seeded contexts for tests that need non-default options (e.g.
+    # mobile viewports); the default `context` fixture goes through it too.
+    contexts = []
+
+    def factory(**kwargs):
+        if os.path.exists(WARM_STATE):
+            kwargs.setdefault("storage_state", WARM_STATE)
+        context = browser.new_context(**kwargs)
+        context.add_init_script(API_KEY_INIT_SCRIPT)
+        # Route handlers live on the context so one install covers every
+        # page it creates. Registration order matters: the asset blocker is
+        # last so its fallback() chains to the cache and the API mocks.
+        install_api_mocks(context)
+        context.route(STATIC_URL_GLOB, cache_route)
+        block_assets(context)
+        contexts.append(context)
+        return context
+
+    yield factory
+    if contexts:
+        contexts[0].storage_state(path=WARM_STATE)
+    for context in contexts:
+        context.close()
+
+
+@pytest.fixture
+def context(context_factory):
+    return context_factory()
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    # Artifacts are captured only when a test actually fails, instead of on
+    # every error path. The full DOM dump stays behind PW_DEBUG_DUMP because
+    # serializing a large SPA through page.content() is expensive and the
+    # screenshot usually suffices.
+    outcome = yield
+    report = outcome.get_result()
+    if report.when != "call" or not report.failed:
+        return
+    page = item.funcargs.get("page")
+    if page is None or page.is_closed():
+        return
+    os.makedirs(ARTIFACTS_DIR, exist_ok=True)
+    page.screenshot(path=os.path.join(ARTIFACTS_DIR, f"{item.name}.png"))
+    if os.getenv("PW_DEBUG_DUMP"):
+        with open(os.path.join(ARTIFACTS_DIR, f"{item.name}.html"), "w") as f:
+            f.write(page.content())
+
+
+@pytest.fixture
+def page(context):
+    page = context.new_page()
+    # One generous default instead of per-assertion timeouts scattered
+    # through the tests.
+    page.set_default_timeout(60000)
+    attach_diagnostics(page)
+    return page
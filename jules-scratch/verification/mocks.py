@@ -0,0 +1,101 @@
+
+import json
+
+# Injected into every document before any app script runs, so dummy API keys
+# sit in the app's truscope_api_keys slot on first render — no storage-state
+# file, no evaluate calls, no reload. Only the Gemini entries are seeded: a
+# factCheck key would make the frontend call the real Google Fact Check API.
+API_KEY_INIT_SCRIPT = (
+    "localStorage.setItem('truscope_api_keys', JSON.stringify("
+    "{gemini: 'DUMMY_KEY', geminiModel: 'gemini-1.5-flash-latest'}));"
+)
+
+# Canned /api/fact-check response matching the FactCheckReport shape produced
+# by api/fact-check.ts. The UI flows only verify rendering, so a deterministic
+# payload replaces the live three-tier pipeline and its 30-60s of wall time.
+MOCK_REPORT = {
+    "id": "verification-mock",
+    "originalText": "Mock content used for UI verification.",
+    "finalVerdict": "MIXED",
+    "finalScore": 72,
+    "reasoning": (
+        "Mocked synthesis: the earnings claim is supported by published "
+        "reporting, while the birthplace claim is contradicted by the "
+        "sources consulted."
+    ),
+    "evidence": [
+        {
+            "id": "mock-evidence-1",
+            "url": "https://example.com/fact-check/onlyfans-earnings",
+            "title": "Fact check: reported OnlyFans earnings",
+            "snippet": "Published figures support the reported monthly earnings.",
+            "publisher": "Example Fact Check",
+            "publicationDate": "2024-01-15",
+            "credibilityScore": 85,
+            "relevanceScore": 90,
+            "type": "claim",
+            "source": {"name": "Example Fact Check", "url": "https://example.com"},
+        },
+        {
+            "id": "mock-evidence-2",
+            "url": "https://example.org/news/derbyshire-profile",
+            "title": "Profile of a Derbyshire creator",
+            "snippet": "The subject was born and raised in Derbyshire, England.",
+            "publisher": "Example News",
+            "publicationDate": "2024-02-02",
+            "credibilityScore": 78,
+            "relevanceScore": 85,
+            "type": "news",
+            "source": {"name": "Example News", "url": "https://example.org"},
+        },
+    ],
+    "metadata": {
+        "methodUsed": "mocked-verification",
+        "processingTimeMs": 12,
+        "apisUsed": [],
+        "sourcesConsulted": {"total": 2, "highCredibility": 1},
+        "warnings": [],
+        "tierBreakdown": [],
+    },
+}
+
+# The analyze button stays disabled until /api/health-check reports the
+# server-side APIs as configured, so the health check is mocked alongside the
+# fact-check itself.
+MOCK_HEALTH = {
+    "status": "healthy",
+    "apis": {"serp": True, "webz": True},
+    "message": "All server-side APIs configured",
+}
+
+_MOCKED_ENDPOINTS = {
+    "**/api/health-check": MOCK_HEALTH,
+    "**/api/fact-check": MOCK_REPORT,
+}
+
+
+def install_api_mocks(target):
+    """Fulfill the backend endpoints the analyze flow depends on.
+
+    `target` may be a Page or a BrowserContext; installing on the context
+    covers every page it creates with a single handler.
+    """
+    for pattern, payload in _MOCKED_ENDPOINTS.items():
+        body = json.dumps(payload)
+        target.route(
+            pattern,
+            lambda route, body=body: route.fulfill(
+                status=200, content_type="application/json", body=body
+            ),
+        )
+
+
+async def install_api_mocks_async(target):
+    """Async twin of install_api_mocks for playwright.async_api flows."""
+    for pattern, payload in _MOCKED_ENDPOINTS.items():
+        body = json.dumps(payload)
+
+        async def handler(route, body=body):
+            await route.fulfill(status=200, content_type="application/json", body=body)
+
+        await target.route(pattern, handler)
@@ -0,0 +1,33 @@
+
+# Resource types no verification flow needs: the screenshots capture DOM/CSS
+# layout and the app's icons are inline SVG, so images, fonts and media are
+# dead weight on every page load.
+BLOCKED_RESOURCE_TYPES = {"image", "font", "media"}
+
+
+def block_assets(target):
+    """Abort requests for non-essential static assets.
+
+    `target` may be a Page or a BrowserContext; installing on the context
+    covers every page it creates with a single handler. Non-blocked requests
+    fall back to any route handler registered earlier (e.g. the static-asset
+    cache) instead of going straight to the network.
+    """
+    target.route(
+        "**/*",
+        lambda route: route.abort()
+        if route.request.resource_type in BLOCKED_RESOURCE_TYPES
+        else route.fallback(),
+    )
+
+
+async def block_assets_async(target):
+    """Async twin of block_assets for flows driven by playwright.async_api."""
+
+    async def handler(route):
+        if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+            await route.abort()
+        else:
+            await route.fallback()
+
+    await target.route("**/*", handler)
@@ -0,0 +1,79 @@
+
+import asyncio
+import os
+
+from playwright.async_api import async_playwright, expect
+
+from cache_route import STATIC_URL_GLOB, cache_route_async
+from mocks import API_KEY_INIT_SCRIPT, install_api_mocks_async
+from routes import block_assets_async
+from verify_changes import TEXT_TO_ANALYZE
+
+BASE_URL = "http://127.0.0.1:3000"
+# Same warm-start state the pytest fixtures use: dumped after a run,
+# reused on the next so repeat runs skip the cold SPA hydration.
+WARM_STATE = os.path.join(os.path.dirname(__file__), "warm_state.json")
+
+
+async def verify_changes(context):
+    page = await context.new_page()
+    page.set_default_timeout(60000)
+    # Same policy as the pytest fixtures: page errors always, full console
+    # forwarding only when explicitly requested.
+    page.on("pageerror", lambda error: print(f"page error: {error}"))
+    if os.getenv("PW_VERBOSE"):
+        page.on("console", lambda msg: print(f"console [{msg.type}] {msg.text}"))
+
+    await page.goto(BASE_URL, wait_until="commit")
+
+    # Wait for the main content to be visible
+    await expect(page.locator("h1:has-text('TruScope Professional')")).to_be_visible()
+
+    # Enter the text to be analyzed
+    await page.get_by_test_id("analysis-panel").locator("textarea").fill(TEXT_TO_ANALYZE)
+
+    # Click the "Analyze Content" button
+    await page.get_by_test_id("analyze-button").click()
+
+    # Wait for the report to be displayed; the mocked backend answers in
+    # milliseconds, so 10s is already generous.
+    await expect(page.locator("h2:has-text('Fact-Check Report')")).to_be_visible(timeout=10000)
+
+    # Take a screenshot of the report
+    await page.screenshot(path="jules-scratch/verification/verification.png")
+
+
+# One coroutine per verification flow. Each flow gets its own BrowserContext
+# from the shared browser, so their network/DOM waits overlap instead of
+# running back to back; wall clock is roughly max(flow) instead of sum(flow).
+VERIFICATIONS = [verify_changes]
+
+
+async def main():
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=True)
+        contexts = []
+        for _ in VERIFICATIONS:
+            if os.path.exists(WARM_STATE):
+                context = await browser.new_context(storage_state=WARM_STATE)
+            else:
+                context = await browser.new_context()
+            await context.add_init_script(API_KEY_INIT_SCRIPT)
+            # Same context-level routing as the pytest fixtures; the asset
+            # blocker goes last so its fallback() chains to the cache and
+            # the API mocks.
+            await install_api_mocks_async(context)
+            await context.route(STATIC_URL_GLOB, cache_route_async)
+            await block_assets_async(context)
+            contexts.append(context)
+        try:
+            await asyncio.gather(*(verify(ctx) for verify, ctx in zip(VERIFICATIONS, contexts)))
+            await contexts[0].storage_state(path=WARM_STATE)
+        finally:
+            for context in contexts:
+                await context.close()
+            await browser.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
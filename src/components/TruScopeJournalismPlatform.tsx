@@ -566,7 +566,7 @@ function AnalysisPanel({ content, setContent, publishingContext, setPublishingCo
           </div>
         </div>
   
-        <div className="bg-white rounded-xl shadow-sm border border-gray-200 p-6">
+        <div data-testid="analysis-panel" className="bg-white rounded-xl shadow-sm border border-gray-200 p-6">
           <h3 className="text-lg font-semibold text-gray-900 mb-4">Content to Verify</h3>
           <textarea
             value={content}
@@ -580,6 +580,7 @@ function AnalysisPanel({ content, setContent, publishingContext, setPublishingCo
             </span>
             <button
               onClick={onAnalyze}
+              data-testid="analyze-button"
               disabled={isAnalyzing || !content.trim() || apiStatus === 'unavailable'}
               className="px-8 py-3 bg-gradient-to-r from-blue-600 to-indigo-600 text-white rounded-lg font-semibold hover:shadow-lg transition-all disabled:opacity-50 disabled:cursor-not-allowed flex items-center space-x-2"
             >